@@ -0,0 +1,51 @@
+"""On-disk cache of issues fetched for created branches."""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+# Cached issues older than this are ignored and fetched again
+CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def _cache_dir() -> Path:
+    """Return the directory holding cached issues."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "gibr" / "issues"
+
+
+def _cache_file(branch_name: str) -> Path:
+    """Return the cache file path for a branch, named by a hash of the branch."""
+    digest = hashlib.sha256(branch_name.encode()).hexdigest()
+    return _cache_dir() / f"{digest}.json"
+
+
+def save_issue(branch_name: str, issue) -> None:
+    """Remember the issue a branch was created for."""
+    try:
+        cache_file = _cache_file(branch_name)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"id": issue.id, "title": issue.title}))
+        logging.debug(f"Cached issue {issue.id} for branch {branch_name}")
+    except (OSError, TypeError) as e:
+        logging.debug(f"Could not cache issue for branch {branch_name}: {e}")
+
+
+def load_issue(branch_name: str, max_age: int = CACHE_MAX_AGE) -> dict | None:
+    """Return the cached issue for a branch, or None if missing or stale."""
+    cache_file = _cache_file(branch_name)
+    try:
+        if time.time() - cache_file.stat().st_mtime > max_age:
+            logging.debug(f"Removing stale cached issue for branch {branch_name}")
+            cache_file.unlink(missing_ok=True)
+            return None
+        cached = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or "id" not in cached or "title" not in cached:
+        return None
+    logging.debug(f"Loaded cached issue {cached['id']} for branch {branch_name}")
+    return cached
@@ -3,6 +3,7 @@
 import click
 
 from gibr.branch import BranchName
+from gibr.cache import save_issue
 from gibr.git import create_and_push_branch
 from gibr.notify import error
 
@@ -17,13 +18,13 @@ def create(ctx, issue_number):
     if tracker.numeric_issues and not issue_number.isdigit():
         error(f"Issue number must be numeric for {tracker.display_name} issue tracker.")
 
+    # Read all config up front so problems surface before any network call
+    branch_name_format = config.config["DEFAULT"]["branch_name_format"]
+    translate_enabled = config.translate_titles
+    auto_push = config.auto_push
+
     issue = tracker.get_issue(issue_number)
-    
-    # Check if translation is enabled in config (default: True)
-    translate_enabled = config.config.get("DEFAULT", {}).get("translate_titles", "true").lower() in ("true", "yes", "1")
     issue.translate = translate_enabled
-    
-    branch_name_format = config.config["DEFAULT"]["branch_name_format"]
 
     # TODO In the future, instead of setting an error here, we should ask if
     # they want to assign the issue to the current user
@@ -31,12 +32,9 @@ def create(ctx, issue_number):
         error(
             "Can't create branch, issue has no assignee and branch format requires it"
         )
-    branch_name = BranchName(config.config["DEFAULT"]["branch_name_format"]).generate(
-        issue
-    )
+    branch_name = BranchName(branch_name_format).generate(issue)
     click.echo(f"Generating branch name for issue #{issue.id}: {issue.title}")
     click.echo(f"Branch name: {branch_name}")
-    
-    # Check if auto_push is enabled in config (default: False)
-    auto_push = config.config.get("DEFAULT", {}).get("auto_push", "false").lower() in ("true", "yes", "1")
+    save_issue(branch_name, issue)
+
     create_and_push_branch(branch_name, auto_push=auto_push)
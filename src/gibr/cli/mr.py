@@ -2,14 +2,19 @@
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
+from gibr.cache import load_issue
 from gibr.factory import get_tracker
-from gibr.mr import GitLabMR, push_current_branch
-from gibr.notify import info, success, warning
+from gibr.mr import GitLabMR, current_branch_name, push_current_branch
+from gibr.notify import error, info, quiet, success, warning
 from gibr.translate import auto_translate_if_needed
 
+# Pattern for Jira-style issue keys (PROJECT-123)
+_ISSUE_ID_RE = re.compile(r"([A-Z][A-Z0-9_]*-\d+)")
+
 
 def extract_issue_id_from_branch(branch_name: str) -> str | None:
     """Extract issue ID from branch name.
@@ -25,14 +30,35 @@ def extract_issue_id_from_branch(branch_name: str) -> str | None:
     Returns:
         Issue ID if found, None otherwise
     """
-    # Pattern for Jira-style issue keys (PROJECT-123)
-    pattern = r"([A-Z][A-Z0-9_]*-\d+)"
-    match = re.search(pattern, branch_name)
+    match = _ISSUE_ID_RE.search(branch_name)
     if match:
         return match.group(1)
     return None
 
 
+def _fetch_issue_title(branch_name: str, issue_id: str, config) -> str:
+    """Fetch the issue title for a branch without printing anything.
+
+    Runs on a worker thread, so all user-facing output is left to the caller.
+
+    Args:
+        branch_name: Git branch name
+        issue_id: Issue ID extracted from the branch name
+        config: Loaded gibr configuration
+
+    Returns:
+        Original (untranslated) issue title
+    """
+    # Reuse the issue cached by `gibr create` when available
+    cached = load_issue(branch_name)
+    if cached and str(cached["id"]) == issue_id:
+        return cached["title"]
+
+    with quiet():
+        tracker = get_tracker(config.config)
+        return tracker.get_issue(issue_id).title
+
+
 @click.command("mr")
 @click.option(
     "--target",
@@ -66,72 +92,81 @@ def mr(ctx, target, title, description, no_push, keep_source):
     """Create a GitLab merge request for the current branch."""
     config = ctx.obj["config"]
 
-    # Initialize GitLab MR client from config
-    gitlab_mr = GitLabMR.from_config(config.config)
-    
-    # Determine keep_source behavior: CLI flag > config > default (False)
-    if keep_source is None:
-        # Check config for default keep_source setting
-        mr_config = config.config.get("gitlab_mr", {})
-        keep_source_str = mr_config.get("keep_source", "false").split("#")[0].strip().lower()
-        keep_source = keep_source_str in ("true", "yes", "1")
-        logging.debug(f"Using keep_source from config: {keep_source}")
-    else:
-        logging.debug(f"Using keep_source from CLI flag: {keep_source}")
-
-    # Push current branch to remote (unless --no-push is specified)
-    if not no_push:
-        info("Pushing current branch to remote...")
-        branch_name, _ = push_current_branch()
-    else:
-        # Get current branch name without pushing
-        from git import Repo
+    # Open the repository once and share it for the whole command
+    from git import Repo
 
+    try:
         repo = Repo(".")
-        if repo.head.is_detached:
-            from gibr.notify import error
+    except Exception as e:
+        error(f"Failed to open git repository: {e}")
+    try:
+        # Initialize GitLab MR client from config
+        gitlab_mr = GitLabMR.from_config(config.config, repo=repo)
 
-            error("HEAD is detached. Please checkout a branch first.")
-        branch_name = repo.active_branch.name
-        repo.close()
-        info(f"Using current branch: {branch_name}")
+        # Determine keep_source behavior: CLI flag > config > default (False)
+        if keep_source is None:
+            # Check config for default keep_source setting
+            keep_source = config.keep_source
+        logging.debug("Using keep_source: %s", keep_source)
+
+        # Resolve the branch up front so pushing and fetching the issue can overlap
+        branch_name = current_branch_name(repo)
+        if no_push:
+            info(f"Using current branch: {branch_name}")
+
+        # Auto-generate title from issue tracker if not provided
+        issue_id = None
+        if not title:
+            issue_id = extract_issue_id_from_branch(branch_name)
+            if issue_id:
+                logging.debug("Extracted issue ID from branch: %s", issue_id)
+            else:
+                logging.debug("No issue ID found in branch name")
 
-    # Auto-generate title from issue tracker if not provided
-    if not title:
-        issue_id = extract_issue_id_from_branch(branch_name)
-        if issue_id:
-            logging.debug(f"Extracted issue ID from branch: {issue_id}")
+        # Fetch the issue title in the background while the branch is pushed
+        executor = ThreadPoolExecutor(max_workers=1)
+        title_future = (
+            executor.submit(_fetch_issue_title, branch_name, issue_id, config)
+            if issue_id
+            else None
+        )
+        try:
+            # Push current branch to remote (unless --no-push is specified)
+            if not no_push:
+                info("Pushing current branch to remote...")
+                push_current_branch(repo=repo, branch_name=branch_name)
+        except Exception:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=False)
+
+        if title_future:
             try:
-                # Get tracker if configured
-                tracker = get_tracker(config.config)
-                logging.debug(f"Using tracker: {tracker.__class__.__name__}")
-                
-                # Fetch issue details
-                issue = tracker.get_issue(issue_id)
-                
-                # Translate title to English if needed
-                translated_title = auto_translate_if_needed(issue.title)
-                
-                # Format as "ISSUE_ID: Translated Title"
-                title = f"{issue.id}: {translated_title}"
-                info(f"Auto-generated MR title: {title}")
+                issue_title = title_future.result()
             except Exception as e:
-                logging.debug(f"Could not fetch issue details: {e}")
-                warning(f"Could not fetch issue {issue_id}, using branch name as title")
+                logging.debug("Could not fetch issue details: %s", e)
+                warning(
+                    f"Could not fetch issue {issue_id}, "
+                    "using branch name as title"
+                )
                 # Fallback to default title generation
                 title = None
-        else:
-            logging.debug("No issue ID found in branch name")
-
-    # Create merge request
-    info("Creating merge request...")
-    mr_info = gitlab_mr.create_merge_request(
-        source_branch=branch_name,
-        target_branch=target,
-        title=title,
-        description=description,
-        remove_source_branch=not keep_source,
-    )
+            else:
+                # Translate title to English if needed
+                title = f"{issue_id}: {auto_translate_if_needed(issue_title)}"
+                info(f"Auto-generated MR title: {title}")
+
+        # Create merge request
+        info("Creating merge request...")
+        mr_info = gitlab_mr.create_merge_request(
+            source_branch=branch_name,
+            target_branch=target,
+            title=title,
+            description=description,
+            remove_source_branch=not keep_source,
+        )
+    finally:
+        repo.close()
 
     # Display success message
     success(
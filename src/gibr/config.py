@@ -7,6 +7,20 @@ from pathlib import Path
 
 from gibr.registry import get_tracker_class
 
+# Boolean options and their defaults, parsed once when the config is loaded
+BOOLEAN_OPTIONS = {
+    "DEFAULT": {"translate_titles": True, "auto_push": False},
+    "gitlab_mr": {"keep_source": False, "insecure": False},
+}
+
+
+def parse_bool(raw, default: bool = False) -> bool:
+    """Parse a config boolean such as "yes # comment" (already parsed bools pass)."""
+    if isinstance(raw, bool):
+        return raw
+    value = raw.split("#", 1)[0].strip().lower()
+    return value in ("true", "yes", "1", "on") if value else default
+
 
 class EnvInterpolation(BasicInterpolation):
     """Expand environment variables inside .gibrconfig."""
@@ -26,6 +40,9 @@ class GibrConfig:
         """Construct GibrConfig object."""
         self.config_file = None
         self.config = {}
+        self.translate_titles = True
+        self.auto_push = False
+        self.keep_source = False
 
     def _find_config_file(self):
         """Search for config file.
@@ -90,6 +107,19 @@ class GibrConfig:
         if parser.defaults():
             config["DEFAULT"] = dict(parser.defaults())
 
+        # Parse boolean options once; everything else reads these values
+        for section, options in BOOLEAN_OPTIONS.items():
+            values = config.get(section)
+            if values is None:
+                continue
+            for key, default in options.items():
+                values[key] = parse_bool(values.get(key, default), default)
+
+        defaults = config.get("DEFAULT", {})
+        self.translate_titles = defaults.get("translate_titles", True)
+        self.auto_push = defaults.get("auto_push", False)
+        self.keep_source = config.get("gitlab_mr", {}).get("keep_source", False)
+
         self.config = config
         logging.debug(str(self))
         return self
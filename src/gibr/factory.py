@@ -1,21 +1,34 @@
 """Factory for issue trackers."""
 
+import functools
+
 from gibr.registry import get_tracker_class
 from gibr.trackers.base import IssueTracker
 
 
 def get_tracker(config) -> IssueTracker:
-    """Return issue tracker instance based on config."""
+    """Return issue tracker instance based on config.
+
+    Trackers are cached per tracker type and settings, so repeated lookups with
+    the same configuration reuse the already constructed client.
+    """
     try:
         tracker_type = config["issue-tracker"]["name"]
     except KeyError:
         raise ValueError("Missing 'issue-tracker.name' in config.")
 
+    tracker_config = frozenset(config.get(tracker_type, {}).items())
+    return _build_tracker(tracker_type, tracker_config)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_tracker(tracker_type: str, tracker_config: frozenset) -> IssueTracker:
+    """Construct a tracker from its type and (hashable) config items."""
     tracker_cls = get_tracker_class(tracker_type)
 
     # Expect each tracker to implement a from_config() constructor.
     if hasattr(tracker_cls, "from_config"):
-        return tracker_cls.from_config(config.get(tracker_type, {}))
+        return tracker_cls.from_config(dict(tracker_config))
     else:
         raise TypeError(
             f"{tracker_cls.__name__} must implement from_config(config_dict)."
@@ -1,8 +1,6 @@
 """Data class for issue representation."""
 
-from dataclasses import dataclass
-
-from slugify import slugify
+from dataclasses import dataclass, field
 
 from gibr.translate import auto_translate_if_needed
 
@@ -16,11 +14,16 @@ class Issue:
     assignee: str
     type: str = "issue"
     translate: bool = True
+    _slug: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def sanitized_title(self) -> str:
-        """Sanitized title with automatic translation if enabled."""
-        title = self.title
-        if self.translate:
-            title = auto_translate_if_needed(title)
-        return slugify(title)
+        """Sanitized title with automatic translation if enabled (computed once)."""
+        if self._slug is not None:
+            return self._slug
+
+        from slugify import slugify
+
+        title = auto_translate_if_needed(self.title) if self.translate else self.title
+        self._slug = slugify(title)
+        return self._slug
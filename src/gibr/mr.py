@@ -1,17 +1,43 @@
 """GitLab Merge Request operations."""
 
 import logging
-import re
-import urllib3
+import subprocess
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 import click
-import gitlab
-from git import Repo
 
+from gibr.config import parse_bool
 from gibr.notify import error, info, success, warning
 
+if TYPE_CHECKING:
+    from git import Repo
 
-def get_project_from_git_remote(remote_name: str = "origin", repo: Repo = None) -> str:
+
+def _parse_project_path(remote_url: str) -> str | None:
+    """Return the project path portion of a Git remote URL, or None.
+
+    Args:
+        remote_url: Remote URL with any trailing ".git" already removed
+
+    Returns:
+        str | None: Project path in format "group/project" if the URL is recognized
+    """
+    # SSH format (git@host:group/project)
+    if remote_url.startswith("git@"):
+        _, _, project_path = remote_url.partition(":")
+    # SSH with protocol (ssh://user@host:port/group/project)
+    # HTTPS format (https://host/group/project)
+    elif remote_url.startswith(("ssh://", "http://", "https://")):
+        project_path = urlsplit(remote_url).path.lstrip("/")
+    else:
+        return None
+    return project_path or None
+
+
+def get_project_from_git_remote(
+    remote_name: str = "origin", repo: "Repo" = None
+) -> str:
     """Extract GitLab project path from Git remote URL.
 
     Supports various Git URL formats:
@@ -30,50 +56,66 @@ def get_project_from_git_remote(remote_name: str = "origin", repo: Repo = None)
         ValueError: If project path cannot be extracted from remote URL
     """
     try:
+        from git import Repo
+
+        # Only close the repository if it was opened here
+        owns_repo = repo is None
         repo = repo or Repo(".")
         remote = repo.remote(name=remote_name)
         remote_url = list(remote.urls)[0]  # Get first URL
-        logging.debug(f"Extracting project from remote URL: {remote_url}")
+        logging.debug("Extracting project from remote URL: %s", remote_url)
 
         # Remove .git suffix if present
         remote_url = remote_url.rstrip("/")
         if remote_url.endswith(".git"):
             remote_url = remote_url[:-4]
 
-        # Pattern 1: SSH format (git@host:group/project)
-        ssh_pattern = r"git@[^:]+:(.+)$"
-        match = re.match(ssh_pattern, remote_url)
-        if match:
-            project_path = match.group(1)
-            logging.debug(f"Extracted project path (SSH format): {project_path}")
-            repo.close()
-            return project_path
-
-        # Pattern 2: HTTPS format (https://host/group/project)
-        https_pattern = r"https?://[^/]+/(.+)$"
-        match = re.match(https_pattern, remote_url)
-        if match:
-            project_path = match.group(1)
-            logging.debug(f"Extracted project path (HTTPS format): {project_path}")
+        if owns_repo:
             repo.close()
-            return project_path
 
-        # Pattern 3: SSH with protocol (ssh://user@host:port/group/project)
-        ssh_protocol_pattern = r"ssh://[^@]+@[^/]+/(.+)$"
-        match = re.match(ssh_protocol_pattern, remote_url)
-        if match:
-            project_path = match.group(1)
-            logging.debug(f"Extracted project path (SSH protocol format): {project_path}")
-            repo.close()
+        project_path = _parse_project_path(remote_url)
+        if project_path:
+            logging.debug("Extracted project path: %s", project_path)
             return project_path
 
-        repo.close()
         raise ValueError(f"Could not extract project path from remote URL: {remote_url}")
 
     except Exception as e:
         error(f"Failed to get project from git remote: {e}")
 
 
+_PROJECT_QUERY = """
+query($projectPath: ID!) {
+  project(fullPath: $projectPath) {
+    repository { rootRef }
+  }
+}
+"""
+
+_CREATE_MR_MUTATION = """
+mutation(
+  $projectPath: ID!
+  $sourceBranch: String!
+  $targetBranch: String!
+  $title: String!
+  $description: String
+  $removeSourceBranch: Boolean
+) {
+  mergeRequestCreate(input: {
+    projectPath: $projectPath
+    sourceBranch: $sourceBranch
+    targetBranch: $targetBranch
+    title: $title
+    description: $description
+    removeSourceBranch: $removeSourceBranch
+  }) {
+    mergeRequest { iid webUrl sourceBranch targetBranch title }
+    errors
+  }
+}
+"""
+
+
 class GitLabMR:
     """Handle GitLab Merge Request operations."""
 
@@ -92,6 +134,9 @@ class GitLabMR:
             project: Project path (e.g., 'group/project')
             insecure: Skip SSL certificate verification
         """
+        import gitlab
+        import urllib3
+
         self.url = url
         self.project_name = project
         self.insecure = insecure
@@ -99,22 +144,64 @@ class GitLabMR:
         # Disable SSL warnings if insecure mode is enabled
         if insecure:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            logging.debug(f"SSL verification disabled for GitLab connection (ssl_verify=False)")
+            logging.debug("SSL verification disabled for GitLab connection (ssl_verify=False)")
 
-        logging.debug(f"Connecting to GitLab at {url} (insecure={insecure}, ssl_verify={not insecure})")
+        logging.debug(
+            "Connecting to GitLab at %s (insecure=%s, ssl_verify=%s)",
+            url,
+            insecure,
+            not insecure,
+        )
 
         try:
             self.client = gitlab.Gitlab(
                 url, private_token=token, ssl_verify=not insecure
             )
-            logging.debug("GitLab client created, authenticating...")
-            self.client.auth()
-            logging.debug("GitLab authentication successful")
-            self.project = self.client.projects.get(project)
-            logging.debug(f"Successfully loaded project: {self.project_name}")
         except Exception as e:
             error(f"Failed to connect to GitLab: {e}")
 
+        # Look the project up right away: this checks the URL, token and project
+        # path before anything else happens (e.g. a push) and supplies the
+        # default target branch
+        data = self._graphql(_PROJECT_QUERY, {"projectPath": project})
+        if not data.get("project"):
+            error(
+                f"GitLab project '{project}' not found or not accessible "
+                "with the configured token"
+            )
+        repository = data["project"].get("repository") or {}
+        self.default_branch = repository.get("rootRef")
+        logging.debug("Successfully loaded project: %s", self.project_name)
+
+    def _graphql(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL request against the GitLab API and return its data.
+
+        Args:
+            query: GraphQL document
+            variables: Variables referenced by the document
+
+        Returns:
+            dict: The "data" member of the GraphQL response
+        """
+        import gitlab
+
+        try:
+            result = self.client.http_post(
+                f"{self.client.url}/api/graphql",
+                post_data={"query": query, "variables": variables},
+            )
+        except gitlab.exceptions.GitlabAuthenticationError as e:
+            error(f"GitLab authentication failed, check the [gitlab_mr] token: {e}")
+        except Exception as e:
+            error(f"GitLab API request failed: {e}")
+
+        if result.get("errors"):
+            messages = "; ".join(
+                err.get("message", str(err)) for err in result["errors"]
+            )
+            error(f"GitLab API request failed: {messages}")
+        return result["data"]
+
     def create_merge_request(
         self,
         source_branch: str,
@@ -125,6 +212,8 @@ class GitLabMR:
     ) -> dict:
         """Create a merge request in GitLab.
 
+        Uses a single GraphQL mutation that takes the project path directly.
+
         Args:
             source_branch: Source branch name
             target_branch: Target branch name (defaults to project's default branch)
@@ -137,39 +226,50 @@ class GitLabMR:
         """
         # Use project default branch if target not specified
         if not target_branch:
-            target_branch = self.project.default_branch
-            logging.debug(f"Using default target branch: {target_branch}")
+            target_branch = self.default_branch
+            if not target_branch:
+                error(
+                    f"Project {self.project_name} has no default branch, "
+                    "please pass --target"
+                )
+            logging.debug("Using default target branch: %s", target_branch)
 
         # Use source branch name as title if not provided
         if not title:
             title = source_branch.replace("-", " ").replace("_", " ").title()
 
-        try:
-            mr = self.project.mergerequests.create(
-                {
-                    "source_branch": source_branch,
-                    "target_branch": target_branch,
-                    "title": title,
-                    "description": description,
-                    "remove_source_branch": remove_source_branch,
-                }
-            )
-            return {
-                "iid": mr.iid,
-                "title": mr.title,
-                "web_url": mr.web_url,
-                "source_branch": mr.source_branch,
-                "target_branch": mr.target_branch,
-            }
-        except Exception as e:
-            error(f"Failed to create merge request: {e}")
+        data = self._graphql(
+            _CREATE_MR_MUTATION,
+            {
+                "projectPath": self.project_name,
+                "sourceBranch": source_branch,
+                "targetBranch": target_branch,
+                "title": title,
+                "description": description,
+                "removeSourceBranch": remove_source_branch,
+            },
+        )
+        payload = data["mergeRequestCreate"]
+        if payload.get("errors"):
+            error(f"Failed to create merge request: {'; '.join(payload['errors'])}")
+
+        mr = payload["mergeRequest"]
+        return {
+            "iid": mr["iid"],
+            "title": mr["title"],
+            "web_url": mr["webUrl"],
+            "source_branch": mr["sourceBranch"],
+            "target_branch": mr["targetBranch"],
+        }
 
     @classmethod
-    def from_config(cls, config: dict):
+    def from_config(cls, config: dict, repo: "Repo" = None):
         """Create GitLabMR instance from configuration dictionary.
 
         Args:
             config: Configuration dictionary with gitlab_mr section
+            repo: Git repository used to auto-detect the project
+                (defaults to current directory)
 
         Returns:
             GitLabMR: Initialized instance
@@ -191,22 +291,50 @@ class GitLabMR:
         project = mr_config.get("project")
         if not project:
             logging.debug("Project not specified in config, auto-detecting from git remote")
-            project = get_project_from_git_remote()
+            project = get_project_from_git_remote(repo=repo)
             info(f"Auto-detected project from git remote: {project}")
         else:
-            logging.debug(f"Using project from config: {project}")
+            logging.debug("Using project from config: %s", project)
 
-        # Optional insecure flag (defaults to False)
-        # Handle inline comments by splitting on # and taking first part
-        insecure_raw = mr_config.get("insecure", "false")
-        insecure_str = insecure_raw.split("#")[0].strip().lower()
-        insecure = insecure_str in ("true", "yes", "1")
-        logging.debug(f"Insecure SSL mode: {insecure} (from config value: '{insecure_raw}' -> parsed: '{insecure_str}')")
+        # Optional insecure flag (defaults to False), normally parsed at config load
+        insecure = parse_bool(mr_config.get("insecure", False))
+        logging.debug("Insecure SSL mode: %s", insecure)
 
         return cls(url=url, token=token, project=project, insecure=insecure)
 
 
-def push_current_branch(repo: Repo = None, branch_name: str = None) -> tuple[str, str]:
+def current_branch_name(repo: "Repo" = None) -> str:
+    """Return the name of the checked out branch with a single git call.
+
+    Args:
+        repo: Git repository object (defaults to running git in the current directory)
+
+    Returns:
+        str: Current branch name
+    """
+    from git.exc import GitCommandError
+
+    try:
+        if repo is not None:
+            branch_name = repo.git.symbolic_ref("--short", "HEAD")
+        else:
+            branch_name = subprocess.check_output(
+                ["git", "symbolic-ref", "--short", "HEAD"],
+                text=True,
+                stderr=subprocess.PIPE,
+            )
+    except (GitCommandError, subprocess.CalledProcessError) as e:
+        stderr = (e.stderr or "").strip()
+        logging.debug("git symbolic-ref failed: %s", stderr)
+        if "is not a symbolic ref" in stderr:
+            error("HEAD is detached. Please checkout a branch first.")
+        error(f"Failed to read current branch: {stderr or e}")
+    return branch_name.strip()
+
+
+def push_current_branch(
+    repo: "Repo" = None, branch_name: str = None
+) -> tuple[str, str]:
     """Push current branch to origin.
 
     Args:
@@ -217,42 +345,46 @@ def push_current_branch(repo: Repo = None, branch_name: str = None) -> tuple[str
         tuple: (branch_name, remote_name)
     """
     try:
+        from git import Repo
+
+        # Only close the repository if it was opened here
+        owns_repo = repo is None
         repo = repo or Repo(".")
 
         # Get current branch name
         if not branch_name:
-            if repo.head.is_detached:
-                error("HEAD is detached. Please checkout a branch first.")
-            branch_name = repo.active_branch.name
+            branch_name = current_branch_name(repo)
 
-        logging.debug(f"Current branch: {branch_name}")
+        logging.debug("Current branch: %s", branch_name)
 
-        # Check if branch exists on remote
+        # Ask the remote for just this branch instead of walking every remote ref
         origin = repo.remote(name="origin")
-        remote_refs = [ref.name for ref in origin.refs]
-        remote_branch = f"origin/{branch_name}"
-
-        if remote_branch not in remote_refs:
+        remote_sha = None
+        remote_ref = f"refs/heads/{branch_name}"
+        for line in repo.git.ls_remote("--heads", "origin", remote_ref).splitlines():
+            sha, _, ref = line.partition("\t")
+            if ref == remote_ref:
+                remote_sha = sha
+                break
+
+        if remote_sha is None:
             info(f"Branch '{branch_name}' not found on remote. Pushing...")
             push_result = origin.push(
                 refspec=f"{branch_name}:{branch_name}", set_upstream=True
             )
             push_result.raise_if_error()
             success(f"Pushed branch '{branch_name}' to origin.")
+        elif repo.head.commit.hexsha != remote_sha:
+            # Local is ahead of remote
+            info(f"Local branch is ahead. Pushing changes...")
+            push_result = origin.push(refspec=f"{branch_name}:{branch_name}")
+            push_result.raise_if_error()
+            success(f"Pushed changes for branch '{branch_name}' to origin.")
         else:
-            # Check if local is ahead of remote
-            local_commit = repo.head.commit
-            remote_commit = origin.refs[branch_name].commit
-
-            if local_commit != remote_commit:
-                info(f"Local branch is ahead. Pushing changes...")
-                push_result = origin.push(refspec=f"{branch_name}:{branch_name}")
-                push_result.raise_if_error()
-                success(f"Pushed changes for branch '{branch_name}' to origin.")
-            else:
-                info(f"Branch '{branch_name}' is up to date with remote.")
-
-        repo.close()
+            info(f"Branch '{branch_name}' is up to date with remote.")
+
+        if owns_repo:
+            repo.close()
         return branch_name, "origin"
 
     except Exception as e:
@@ -1,29 +1,53 @@
 """Utility functions for displaying notifications in the CLI using Click."""
 
+import logging
+import threading
+from contextlib import contextmanager
+
 import click
 
+_local = threading.local()
+
+
+@contextmanager
+def quiet():
+    """Suppress notifications from the current thread (error() still raises)."""
+    _local.quiet = True
+    try:
+        yield
+    finally:
+        _local.quiet = False
+
+
+def _secho(msg, **styles):
+    """Print a styled message, or only log it if the current thread is quiet."""
+    if getattr(_local, "quiet", False):
+        logging.debug("Suppressed notification: %s", msg)
+    else:
+        click.secho(msg, **styles)
+
 
 def info(msg):
     """Display an informational message."""
-    click.secho(f"ℹ️  {msg}", fg="blue")
+    _secho(f"ℹ️  {msg}", fg="blue")
 
 
 def success(msg):
     """Display a success message."""
-    click.secho(f"✅  {msg}", fg="green", bold=True)
+    _secho(f"✅  {msg}", fg="green", bold=True)
 
 
 def party(msg):
     """Display a celebratory message."""
-    click.secho(f"🎉  {msg}", fg="magenta", bold=True)
+    _secho(f"🎉  {msg}", fg="magenta", bold=True)
 
 
 def warning(msg):
     """Display a warning message."""
-    click.secho(f"⚠️  {msg}", fg="yellow")
+    _secho(f"⚠️  {msg}", fg="yellow")
 
 
 def error(msg):
     """Display an error message."""
-    click.secho(f"❌  {msg}", fg="red", bold=True)
+    _secho(f"❌  {msg}", fg="red", bold=True)
     raise click.Abort()
@@ -1,11 +1,44 @@
 """Base class for issue trackers."""
 
+import functools
+import logging
 import os
+import time
 from abc import ABC, abstractmethod
 
 import click
 
-from gibr.notify import party, warning
+from gibr.notify import error, party, warning
+
+# Attempts made for a tracker call that keeps hitting the API rate limit
+RATE_LIMIT_ATTEMPTS = 3
+
+
+class RateLimitError(Exception):
+    """Raised by trackers when their API answers 429 Too Many Requests."""
+
+
+def retry_on_rate_limit(func):
+    """Retry a tracker method with exponential backoff on RateLimitError."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            try:
+                return func(self, *args, **kwargs)
+            except RateLimitError as e:
+                if attempt == RATE_LIMIT_ATTEMPTS - 1:
+                    error(
+                        f"{self.display_name} API rate limit exceeded ({e}). "
+                        "Please try again later."
+                    )
+                delay = 2**attempt
+                logging.debug(
+                    f"{self.display_name} rate limited, retrying in {delay}s"
+                )
+                time.sleep(delay)
+
+    return wrapper
 
 
 class IssueTracker(ABC):
@@ -3,13 +3,16 @@
 import click
 from github import Auth, Github
 from github import Issue as GithubIssue
-from github.GithubException import UnknownObjectException
+from github.GithubException import (
+    RateLimitExceededException,
+    UnknownObjectException,
+)
 
 from gibr.issue import Issue
 from gibr.notify import error
 from gibr.registry import register_tracker
 
-from .base import IssueTracker
+from .base import IssueTracker, RateLimitError, retry_on_rate_limit
 
 
 @register_tracker(
@@ -58,12 +61,15 @@ class GithubTracker(IssueTracker):
         """Get issue assignee."""
         return issue.assignee.login if issue.assignee else None
 
+    @retry_on_rate_limit
     def get_issue(self, issue_id: str) -> dict:
         """Fetch issue details by issue number."""
         try:
             issue = self.repo.get_issue(number=int(issue_id))
         except UnknownObjectException:
             error(f"Issue #{issue_id} not found in repository.")
+        except RateLimitExceededException as e:
+            raise RateLimitError(e) from e
         return Issue(
             id=issue.number, title=issue.title, assignee=self._get_assignee(issue)
         )
@@ -1,5 +1,7 @@
 """GitLab issue tracker integration."""
 
+from http import HTTPStatus
+
 import click
 import gitlab
 from gitlab.exceptions import GitlabGetError
@@ -7,7 +9,7 @@ from gitlab.exceptions import GitlabGetError
 from gibr.issue import Issue
 from gibr.notify import error
 from gibr.registry import register_tracker
-from gibr.trackers.base import IssueTracker
+from gibr.trackers.base import IssueTracker, RateLimitError, retry_on_rate_limit
 
 
 @register_tracker(
@@ -78,11 +80,14 @@ class GitlabTracker(IssueTracker):
         # No assignee found
         return None
 
+    @retry_on_rate_limit
     def get_issue(self, issue_id: str) -> dict:
         """Fetch issue details by issue id."""
         try:
             issue = self.project.issues.get(issue_id)
-        except GitlabGetError:
+        except GitlabGetError as e:
+            if e.response_code == HTTPStatus.TOO_MANY_REQUESTS:
+                raise RateLimitError(e) from e
             error(f"Issue #{issue_id} not found in GitLab project {self.project_name}.")
         return Issue(
             id=issue.iid, title=issue.title, assignee=self._get_assignee(issue)
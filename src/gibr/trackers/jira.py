@@ -2,6 +2,7 @@
 
 import logging
 import re
+from http import HTTPStatus
 from textwrap import dedent
 
 import click
@@ -13,7 +14,7 @@ from gibr.issue import Issue
 from gibr.notify import error
 from gibr.registry import register_tracker
 
-from .base import IssueTracker
+from .base import IssueTracker, RateLimitError, retry_on_rate_limit
 
 
 @register_tracker(key="jira", display_name="Jira", numeric_issues=False)
@@ -171,6 +172,7 @@ class JiraTracker(IssueTracker):
 
         return None
 
+    @retry_on_rate_limit
     def get_issue(self, issue_id: str) -> dict:
         """Fetch issue details by issue number (using project key)."""
         if issue_id.isdigit() and not self.project_key:
@@ -189,7 +191,9 @@ class JiraTracker(IssueTracker):
         )
         try:
             issue = self.client.issue(issue_key)
-        except JIRAError:
+        except JIRAError as e:
+            if e.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                raise RateLimitError(e) from e
             if self.project_key:
                 error(
                     f"Issue {issue_key} not found in Jira project {self.project_key}."
@@ -11,7 +11,7 @@ from gibr.issue import Issue
 from gibr.notify import error
 from gibr.registry import register_tracker
 
-from .base import IssueTracker
+from .base import IssueTracker, RateLimitError, retry_on_rate_limit
 
 
 @register_tracker(key="linear", display_name="Linear", numeric_issues=False)
@@ -94,6 +94,8 @@ class LinearTracker(IssueTracker):
         if variables:
             payload["variables"] = variables
         response = requests.post(self.API_URL, json=payload, headers=headers)
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            raise RateLimitError(response.text)
         if response.status_code != HTTPStatus.OK:
             error(f"Linear API request failed: {response.text}")
         data = response.json()
@@ -109,6 +111,7 @@ class LinearTracker(IssueTracker):
             else None
         )
 
+    @retry_on_rate_limit
     def get_issue(self, issue_id: str) -> dict:
         """Fetch issue details by issue key (TEAM-123) or number."""
         if issue_id.isdigit():
@@ -157,6 +160,7 @@ class LinearTracker(IssueTracker):
             assignee=self._get_assignee(issue),
         )
 
+    @retry_on_rate_limit
     def list_issues(self) -> list[dict]:
         """List open issues from the Linear team (if configured)."""
         team_filter = 'team: { key: { eq: "%s" } },' % self.team if self.team else ""  # noqa: UP031
@@ -1,9 +1,49 @@
 """Translation utilities for issue titles."""
 
+import functools
 import logging
-import re
 
-from deep_translator import GoogleTranslator
+# Every character of the Unicode "Cyrillic" block (U+0400..U+04FF)
+_CYRILLIC_CHARS = frozenset(map(chr, range(0x0400, 0x0500)))
+
+
+class _SessionRequests:
+    """Stand-in for the requests module that sends GETs over one keep-alive session."""
+
+    def __init__(self, requests_module, session):
+        """Construct _SessionRequests object."""
+        self._requests = requests_module
+        self.get = session.get
+
+    def __getattr__(self, name):
+        """Fall back to the real requests module for everything else."""
+        return getattr(self._requests, name)
+
+
+@functools.cache
+def _use_shared_session() -> None:
+    """Make deep_translator's Google backend reuse one HTTP connection.
+
+    GoogleTranslator calls requests.get() directly, which opens a new TCP/TLS
+    connection for every translation; only that module's reference is swapped.
+    """
+    import requests
+    from deep_translator import google
+
+    google.requests = _SessionRequests(requests, requests.Session())
+
+
+@functools.lru_cache(maxsize=8)
+def _get_translator(source_lang: str = "ru"):
+    """Return the shared translator from source_lang to English.
+
+    deep_translator pulls in requests and bs4, so it is only imported once a
+    translation is actually needed.
+    """
+    from deep_translator import GoogleTranslator
+
+    _use_shared_session()
+    return GoogleTranslator(source=source_lang, target="en")
 
 
 def detect_cyrillic(text: str) -> bool:
@@ -15,8 +55,8 @@ def detect_cyrillic(text: str) -> bool:
     Returns:
         True if text contains Cyrillic characters, False otherwise
     """
-    cyrillic_pattern = re.compile(r'[а-яА-ЯёЁ]')
-    return bool(cyrillic_pattern.search(text))
+    # isdisjoint() walks the string in C and stops at the first Cyrillic char
+    return not _CYRILLIC_CHARS.isdisjoint(text)
 
 
 def translate_to_english(text: str, source_lang: str = "ru") -> str:
@@ -33,8 +73,7 @@ def translate_to_english(text: str, source_lang: str = "ru") -> str:
         return text
     
     try:
-        translator = GoogleTranslator(source=source_lang, target="en")
-        translated = translator.translate(text)
+        translated = _get_translator(source_lang).translate(text)
         logging.debug(f"Translated '{text}' to '{translated}'")
         return translated
     except Exception as e:
@@ -42,8 +81,11 @@ def translate_to_english(text: str, source_lang: str = "ru") -> str:
         return text
 
 
+@functools.lru_cache(maxsize=512)
 def auto_translate_if_needed(text: str) -> str:
     """Automatically translate text to English if it contains Cyrillic characters.
+
+    Results are memoized per process so the same title is only translated once.
     
     Args:
         text: The text to potentially translate
@@ -51,7 +93,8 @@ def auto_translate_if_needed(text: str) -> str:
     Returns:
         Translated text if Cyrillic was detected, otherwise original text
     """
-    if not text:
+    # Pure ASCII text (the common case) can't contain Cyrillic characters
+    if not text or text.isascii():
         return text
     
     if detect_cyrillic(text):
@@ -59,4 +102,3 @@ def auto_translate_if_needed(text: str) -> str:
         return translate_to_english(text)
     
     return text
-
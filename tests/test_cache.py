@@ -0,0 +1,49 @@
+"""Tests for the on-disk issue cache."""
+
+import os
+from unittest.mock import MagicMock
+
+from gibr.cache import _cache_file, load_issue, save_issue
+
+
+def test_save_and_load_issue_roundtrip():
+    """Should load back the issue saved for a branch."""
+    save_issue("feature/PROJ-1-fix-login", MagicMock(id="PROJ-1", title="Fix login"))
+
+    assert load_issue("feature/PROJ-1-fix-login") == {
+        "id": "PROJ-1",
+        "title": "Fix login",
+    }
+
+
+def test_load_issue_missing_returns_none():
+    """Should return None when no issue was cached for the branch."""
+    assert load_issue("unknown-branch") is None
+
+
+def test_load_issue_stale_returns_none():
+    """Should ignore cache entries older than max_age."""
+    save_issue("42-old", MagicMock(id=42, title="Old issue"))
+    cache_file = _cache_file("42-old")
+    os.utime(cache_file, (0, 0))
+
+    assert load_issue("42-old") is None
+    assert not cache_file.exists()
+
+
+def test_cache_files_do_not_collide():
+    """Branch names that differ only by slashes should get separate entries."""
+    save_issue("a/b", MagicMock(id="A-1", title="Slash"))
+    save_issue("a__b", MagicMock(id="A-2", title="Underscores"))
+
+    assert load_issue("a/b")["id"] == "A-1"
+    assert load_issue("a__b")["id"] == "A-2"
+
+
+def test_load_issue_corrupt_returns_none():
+    """Should ignore cache files that are not valid JSON."""
+    cache_file = _cache_file("broken")
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text("not json")
+
+    assert load_issue("broken") is None
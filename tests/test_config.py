@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gibr.config import EnvInterpolation, GibrConfig
+from gibr.config import EnvInterpolation, GibrConfig, parse_bool
 
 
 @pytest.fixture
@@ -147,3 +147,45 @@ def test_str_includes_expected_sections():
         assert "Branch Name Format" in output
         assert "fake" in output
         assert "Fake details" in output
+
+
+@pytest.mark.parametrize(
+    "raw, default, expected",
+    [
+        ("true", False, True),
+        ("Yes  # enable it", False, True),
+        ("on", False, True),
+        ("false # comment", True, False),
+        ("0", True, False),
+        ("", True, True),
+        ("  # only a comment", False, False),
+        (True, False, True),
+    ],
+)
+def test_parse_bool(raw, default, expected):
+    """parse_bool should handle inline comments, blanks and parsed bools."""
+    assert parse_bool(raw, default) is expected
+
+
+def test_load_parses_boolean_options(tmp_path):
+    """load() should convert known boolean options to bools once."""
+    cfg_path = tmp_path / ".gibrconfig"
+    cfg_path.write_text(
+        dedent("""
+            [DEFAULT]
+            branch_name_format = {issue}-{title}
+            auto_push = yes # push right away
+
+            [gitlab_mr]
+            url = https://gitlab.example.com
+            insecure = true
+        """)
+    )
+    with patch("pathlib.Path.cwd", return_value=tmp_path):
+        g = GibrConfig().load()
+
+    assert g.auto_push is True
+    assert g.translate_titles is True
+    assert g.keep_source is False
+    assert g.config["DEFAULT"]["auto_push"] is True
+    assert g.config["gitlab_mr"]["insecure"] is True
@@ -7,6 +7,14 @@ import pytest
 import gibr.factory
 
 
+@pytest.fixture(autouse=True)
+def clear_tracker_cache():
+    """Ensure cached trackers do not leak between tests."""
+    gibr.factory._build_tracker.cache_clear()
+    yield
+    gibr.factory._build_tracker.cache_clear()
+
+
 @pytest.mark.parametrize(
     "bad_config",
     [
@@ -64,3 +72,19 @@ def test_get_tracker_raises_if_no_from_config(mock_get_tracker_class):
         gibr.factory.get_tracker(config)
 
     assert "must implement from_config" in str(excinfo.value)
+
+
+@patch("gibr.factory.get_tracker_class")
+def test_get_tracker_reuses_instance_for_same_config(mock_get_tracker_class):
+    """get_tracker should construct the tracker only once for the same config."""
+    fake_tracker_cls = mock_get_tracker_class.return_value
+    config = {
+        "issue-tracker": {"name": "somekey"},
+        "somekey": {"foo": "bar"},
+    }
+
+    first = gibr.factory.get_tracker(config)
+    second = gibr.factory.get_tracker(dict(config))
+
+    assert first is second
+    fake_tracker_cls.from_config.assert_called_once_with({"foo": "bar"})
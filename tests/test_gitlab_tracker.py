@@ -1,5 +1,6 @@
 """Tests for the GitlabTracker class."""
 
+from http import HTTPStatus
 from unittest.mock import MagicMock, patch
 
 import click
@@ -94,6 +95,25 @@ def test_get_issue_not_found(
     )
 
 
+@patch("gibr.trackers.base.time.sleep")
+@patch("gibr.trackers.gitlab.gitlab.Gitlab")
+def test_get_issue_retries_when_rate_limited(
+    mock_gitlab_cls, mock_sleep, mock_gitlab_client, mock_gitlab_project
+):
+    """get_issue should back off and retry when GitLab answers 429."""
+    mock_gitlab_cls.return_value = mock_gitlab_client
+    issue = mock_gitlab_project.issues.get.return_value
+    mock_gitlab_project.issues.get.side_effect = [
+        GitlabGetError("Too Many Requests", HTTPStatus.TOO_MANY_REQUESTS),
+        issue,
+    ]
+    tracker = GitlabTracker(url="https://gitlab.com", token="tok", project="group/proj")
+
+    assert tracker.get_issue("42").title == "Fix pipeline bug"
+    assert mock_gitlab_project.issues.get.call_args_list == [(("42",),), (("42",),)]
+    mock_sleep.assert_called_once_with(1)
+
+
 @patch("gibr.trackers.gitlab.gitlab.Gitlab")
 def test_list_issues_returns_list(
     mock_gitlab_cls, mock_gitlab_client, mock_gitlab_project
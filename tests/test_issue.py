@@ -15,7 +15,7 @@ def test_issue_initialization():
     assert issue.assignee == "username"
 
 
-@patch("gibr.issue.slugify", return_value="fake-slug")
+@patch("slugify.slugify", return_value="fake-slug")
 def test_sanitized_title_uses_slugify_and_default_issue(mock_slugify):
     """Ensure sanitized_title delegates to slugify with the issue title."""
     issue = Issue(id=1, title="Example Title", assignee="username")
@@ -24,3 +24,25 @@ def test_sanitized_title_uses_slugify_and_default_issue(mock_slugify):
 
     mock_slugify.assert_called_once_with("Example Title")
     assert result == "fake-slug"
+
+
+@patch("gibr.issue.auto_translate_if_needed", return_value="Fix login")
+@patch("slugify.slugify", return_value="fix-login")
+def test_sanitized_title_is_computed_once(mock_slugify, mock_translate):
+    """sanitized_title should translate and slugify only on first access."""
+    issue = Issue(id=1, title="Исправить вход", assignee="username")
+
+    assert issue.sanitized_title == "fix-login"
+    assert issue.sanitized_title == "fix-login"
+
+    mock_translate.assert_called_once_with("Исправить вход")
+    mock_slugify.assert_called_once_with("Fix login")
+
+
+@patch("gibr.issue.auto_translate_if_needed")
+def test_sanitized_title_skips_translation_when_disabled(mock_translate):
+    """sanitized_title should not translate when translation is disabled."""
+    issue = Issue(id=1, title="Fix login", assignee="username", translate=False)
+
+    assert issue.sanitized_title == "fix-login"
+    mock_translate.assert_not_called()
@@ -88,6 +88,63 @@ def test_get_issue_not_found_triggers_error(mock_post, mock_error):
     assert "not found" in mock_error.call_args[0][0]
 
 
+@patch("gibr.trackers.base.time.sleep")
+def test_get_issue_retries_when_rate_limited(mock_sleep, mock_post):
+    """get_issue should back off and retry after HTTP 429 from Linear."""
+    tracker = LinearTracker(token="t", team="ENG")
+    mock_post.side_effect = [
+        make_response(status=HTTPStatus.TOO_MANY_REQUESTS),
+        make_response(
+            json_data={
+                "data": {
+                    "issues": {
+                        "nodes": [
+                            {"id": "abc", "identifier": "ENG-7", "title": "Retry"}
+                        ]
+                    }
+                }
+            }
+        ),
+    ]
+
+    issue = tracker.get_issue("ENG-7")
+
+    assert issue.title == "Retry"
+    mock_sleep.assert_called_once_with(1)
+
+
+@patch("gibr.trackers.base.error", side_effect=click.Abort)
+@patch("gibr.trackers.base.time.sleep")
+def test_get_issue_gives_up_after_repeated_rate_limits(
+    mock_sleep, mock_error, mock_post
+):
+    """get_issue should call error() once every retry was rate limited."""
+    tracker = LinearTracker(token="t", team="ENG")
+    mock_post.return_value = make_response(status=HTTPStatus.TOO_MANY_REQUESTS)
+
+    with pytest.raises(click.Abort):
+        tracker.get_issue("ENG-7")
+
+    assert mock_sleep.call_args_list == [((1,),), ((2,),)]
+    mock_error.assert_called_once()
+    assert "rate limit" in mock_error.call_args[0][0]
+
+
+@patch("gibr.trackers.base.error", side_effect=click.Abort)
+@patch("gibr.trackers.base.time.sleep")
+def test_list_issues_rate_limited_triggers_error(mock_sleep, mock_error, mock_post):
+    """list_issues should retry on HTTP 429 and then stop cleanly via error()."""
+    tracker = LinearTracker(token="t", team="ENG")
+    mock_post.return_value = make_response(status=HTTPStatus.TOO_MANY_REQUESTS)
+
+    with pytest.raises(click.Abort):
+        tracker.list_issues()
+
+    assert mock_sleep.call_args_list == [((1,),), ((2,),)]
+    mock_error.assert_called_once()
+    assert "rate limit" in mock_error.call_args[0][0]
+
+
 @patch("gibr.trackers.linear.error", side_effect=click.Abort)
 def test_init_invalid_team_key_triggers_error(mock_error):
     """Invalid team key should call error()."""
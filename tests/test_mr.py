@@ -0,0 +1,313 @@
+"""Tests for GitLab merge request helpers."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import click
+import gitlab
+import pytest
+from git.exc import GitCommandError
+
+from gibr.mr import (
+    _CREATE_MR_MUTATION,
+    _PROJECT_QUERY,
+    GitLabMR,
+    current_branch_name,
+    get_project_from_git_remote,
+    push_current_branch,
+)
+
+
+@pytest.mark.parametrize(
+    "remote_url",
+    [
+        "git@gitlab.example.com:group/project.git",
+        "https://gitlab.example.com/group/project.git",
+        "http://gitlab.example.com/group/project/",
+        "ssh://git@gitlab.example.com:2222/group/project.git",
+    ],
+)
+def test_get_project_from_git_remote_supported_formats(remote_url):
+    """Should extract the project path from all supported remote URL formats."""
+    repo = MagicMock()
+    repo.remote.return_value.urls = [remote_url]
+
+    assert get_project_from_git_remote(repo=repo) == "group/project"
+    # The caller owns a repository it passes in
+    repo.close.assert_not_called()
+
+
+def test_get_project_from_git_remote_nested_groups():
+    """Should keep nested subgroups in the extracted project path."""
+    repo = MagicMock()
+    repo.remote.return_value.urls = ["git@gitlab.example.com:group/sub/project.git"]
+
+    assert get_project_from_git_remote(repo=repo) == "group/sub/project"
+
+
+@pytest.mark.parametrize(
+    "remote_url", ["/srv/git/project.git", "https://gitlab.example.com"]
+)
+def test_get_project_from_git_remote_unsupported_url(remote_url):
+    """Should abort when the project path cannot be extracted."""
+    repo = MagicMock()
+    repo.remote.return_value.urls = [remote_url]
+
+    with pytest.raises(click.Abort):
+        get_project_from_git_remote(repo=repo)
+
+
+PROJECT_RESPONSE = {"data": {"project": {"repository": {"rootRef": "main"}}}}
+
+
+def _mr_response(target_branch="main", errors=None):
+    """Return a mergeRequestCreate GraphQL response."""
+    merge_request = {
+        "iid": "7",
+        "title": "PROJ-1: Fix login",
+        "webUrl": "https://gitlab.example.com/group/project/-/merge_requests/7",
+        "sourceBranch": "PROJ-1-fix-login",
+        "targetBranch": target_branch,
+    }
+    return {
+        "data": {
+            "mergeRequestCreate": {
+                "mergeRequest": None if errors else merge_request,
+                "errors": errors or [],
+            }
+        }
+    }
+
+
+@patch("gitlab.Gitlab")
+def test_from_config_builds_client_from_settings(mock_gitlab):
+    """from_config should build the GitLab client from the [gitlab_mr] section."""
+    mock_gitlab.return_value.http_post.return_value = PROJECT_RESPONSE
+    config = {
+        "gitlab_mr": {
+            "url": "https://gitlab.example.com",
+            "token": "secret",
+            "project": "group/project",
+        }
+    }
+
+    mr = GitLabMR.from_config(config)
+
+    assert mr.project_name == "group/project"
+    mock_gitlab.assert_called_once_with(
+        "https://gitlab.example.com", private_token="secret", ssl_verify=True
+    )
+
+
+@patch("gitlab.Gitlab")
+def test_from_config_parses_raw_insecure_string(mock_gitlab):
+    """A raw "false" string must not disable SSL verification."""
+    mock_gitlab.return_value.http_post.return_value = PROJECT_RESPONSE
+    config = {
+        "gitlab_mr": {
+            "url": "https://gitlab.example.com",
+            "token": "secret",
+            "project": "group/project",
+            "insecure": "false",
+        }
+    }
+
+    mr = GitLabMR.from_config(config)
+
+    assert mr.insecure is False
+    mock_gitlab.assert_called_once_with(
+        "https://gitlab.example.com", private_token="secret", ssl_verify=True
+    )
+
+
+@patch("gitlab.Gitlab")
+def test_init_checks_project_with_one_graphql_query(mock_gitlab):
+    """GitLabMR should validate the project up front with a single query."""
+    client = mock_gitlab.return_value
+    client.url = "https://gitlab.example.com"
+    client.http_post.return_value = PROJECT_RESPONSE
+
+    mr = GitLabMR("https://gitlab.example.com", "secret", "group/project")
+
+    client.auth.assert_not_called()
+    client.projects.get.assert_not_called()
+    client.http_post.assert_called_once()
+    url = client.http_post.call_args.args[0]
+    assert url == "https://gitlab.example.com/api/graphql"
+    variables = client.http_post.call_args.kwargs["post_data"]["variables"]
+    assert variables == {"projectPath": "group/project"}
+    assert mr.default_branch == "main"
+
+
+@patch("gibr.mr.error", side_effect=click.Abort)
+@patch("gitlab.Gitlab")
+def test_init_reports_missing_project(mock_gitlab, mock_error):
+    """GitLabMR should abort when the project is not visible to the token."""
+    mock_gitlab.return_value.http_post.return_value = {"data": {"project": None}}
+
+    with pytest.raises(click.Abort):
+        GitLabMR("https://gitlab.example.com", "secret", "group/missing")
+
+    assert "group/missing" in mock_error.call_args.args[0]
+
+
+@patch("gibr.mr.error", side_effect=click.Abort)
+@patch("gitlab.Gitlab")
+def test_init_reports_authentication_failure(mock_gitlab, mock_error):
+    """GitLabMR should report a bad token before anything else runs."""
+    mock_gitlab.return_value.http_post.side_effect = (
+        gitlab.exceptions.GitlabAuthenticationError("401 Unauthorized")
+    )
+
+    with pytest.raises(click.Abort):
+        GitLabMR("https://gitlab.example.com", "bad", "group/project")
+
+    assert "authentication failed" in mock_error.call_args.args[0]
+
+
+@patch("gitlab.Gitlab")
+def test_create_merge_request_uses_single_graphql_mutation(mock_gitlab):
+    """create_merge_request should create the MR with one GraphQL mutation."""
+    client = mock_gitlab.return_value
+    client.http_post.side_effect = [PROJECT_RESPONSE, _mr_response("develop")]
+
+    mr = GitLabMR("https://gitlab.example.com", "secret", "group/project")
+    result = mr.create_merge_request(
+        "PROJ-1-fix-login", target_branch="develop", title="PROJ-1: Fix login"
+    )
+
+    queries = [c.kwargs["post_data"]["query"] for c in client.http_post.call_args_list]
+    assert queries == [_PROJECT_QUERY, _CREATE_MR_MUTATION]
+    variables = client.http_post.call_args.kwargs["post_data"]["variables"]
+    assert variables["projectPath"] == "group/project"
+    assert variables["targetBranch"] == "develop"
+    assert variables["removeSourceBranch"] is True
+    assert result["iid"] == "7"
+    assert result["target_branch"] == "develop"
+
+
+@patch("gitlab.Gitlab")
+def test_create_merge_request_defaults_target_without_extra_call(mock_gitlab):
+    """create_merge_request should reuse the default branch found at init."""
+    client = mock_gitlab.return_value
+    client.http_post.side_effect = [PROJECT_RESPONSE, _mr_response()]
+
+    mr = GitLabMR("https://gitlab.example.com", "secret", "group/project")
+    result = mr.create_merge_request("feature")
+
+    variables = client.http_post.call_args.kwargs["post_data"]["variables"]
+    assert variables["targetBranch"] == "main"
+    assert variables["title"] == "Feature"
+    assert result["target_branch"] == "main"
+
+
+@patch("gibr.mr.error", side_effect=click.Abort)
+@patch("gitlab.Gitlab")
+def test_create_merge_request_reports_mutation_errors(mock_gitlab, mock_error):
+    """create_merge_request should surface errors returned by the mutation."""
+    mock_gitlab.return_value.http_post.side_effect = [
+        PROJECT_RESPONSE,
+        _mr_response(errors=["Another open merge request already exists"]),
+    ]
+
+    mr = GitLabMR("https://gitlab.example.com", "secret", "group/project")
+    with pytest.raises(click.Abort):
+        mr.create_merge_request("feature", target_branch="main")
+
+    mock_error.assert_called_once_with(
+        "Failed to create merge request: Another open merge request already exists"
+    )
+
+
+@patch("gibr.mr.success")
+@patch("gibr.mr.info")
+def test_push_current_branch_pushes_new_branch(mock_info, mock_success):
+    """push_current_branch should push with upstream when the remote lacks it."""
+    repo = MagicMock()
+    repo.git.ls_remote.return_value = "abc123\trefs/heads/other/feature"
+
+    assert push_current_branch(repo=repo, branch_name="feature") == (
+        "feature",
+        "origin",
+    )
+    repo.git.ls_remote.assert_called_once_with(
+        "--heads", "origin", "refs/heads/feature"
+    )
+    repo.remote.return_value.push.assert_called_once_with(
+        refspec="feature:feature", set_upstream=True
+    )
+
+
+@patch("gibr.mr.info")
+def test_push_current_branch_skips_up_to_date_branch(mock_info):
+    """push_current_branch should not push when remote matches local HEAD."""
+    repo = MagicMock()
+    repo.head.commit.hexsha = "abc123"
+    repo.git.ls_remote.return_value = "abc123\trefs/heads/feature"
+
+    push_current_branch(repo=repo, branch_name="feature")
+
+    repo.remote.return_value.push.assert_not_called()
+    mock_info.assert_called_once_with("Branch 'feature' is up to date with remote.")
+
+
+@patch("gibr.mr.success")
+@patch("gibr.mr.info")
+def test_push_current_branch_pushes_when_ahead(mock_info, mock_success):
+    """push_current_branch should push when local HEAD differs from the remote."""
+    repo = MagicMock()
+    repo.head.commit.hexsha = "def456"
+    repo.git.ls_remote.return_value = "abc123\trefs/heads/feature"
+
+    push_current_branch(repo=repo, branch_name="feature")
+
+    repo.remote.return_value.push.assert_called_once_with(refspec="feature:feature")
+
+
+def test_current_branch_name_uses_symbolic_ref():
+    """current_branch_name should read the branch via git symbolic-ref."""
+    repo = MagicMock()
+    repo.git.symbolic_ref.return_value = "feature\n"
+
+    assert current_branch_name(repo) == "feature"
+    repo.git.symbolic_ref.assert_called_once_with("--short", "HEAD")
+
+
+@patch("gibr.mr.error", side_effect=click.Abort)
+@patch(
+    "gibr.mr.subprocess.check_output",
+    side_effect=subprocess.CalledProcessError(
+        128, "git", stderr="fatal: ref HEAD is not a symbolic ref\n"
+    ),
+)
+def test_current_branch_name_detached_head(_mock_check_output, mock_error):
+    """current_branch_name should abort when HEAD is not on a branch."""
+    with pytest.raises(click.Abort):
+        current_branch_name()
+
+    mock_error.assert_called_once_with(
+        "HEAD is detached. Please checkout a branch first."
+    )
+
+
+@patch("gibr.mr.error", side_effect=click.Abort)
+def test_current_branch_name_reports_other_git_errors(mock_error):
+    """Git failures other than a detached HEAD should surface git's message."""
+    repo = MagicMock()
+    repo.git.symbolic_ref.side_effect = GitCommandError(
+        ["git", "symbolic-ref"], 128, stderr="fatal: not a git repository"
+    )
+
+    with pytest.raises(click.Abort):
+        current_branch_name(repo)
+
+    message = mock_error.call_args[0][0]
+    assert message.startswith("Failed to read current branch:")
+    assert "not a git repository" in message
+
+
+@patch("gibr.mr.subprocess.check_output", side_effect=FileNotFoundError("git"))
+def test_current_branch_name_does_not_mask_missing_git(_mock_check_output):
+    """A missing git executable should not be reported as a detached HEAD."""
+    with pytest.raises(FileNotFoundError):
+        current_branch_name()
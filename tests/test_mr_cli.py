@@ -0,0 +1,142 @@
+"""Tests for the mr command."""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from gibr.cli.mr import extract_issue_id_from_branch, mr
+from gibr.notify import error
+
+MR_INFO = {
+    "iid": "7",
+    "title": "PROJ-1: Fix login",
+    "source_branch": "PROJ-1-fix-login",
+    "target_branch": "main",
+    "web_url": "https://gitlab.example.com/group/project/-/merge_requests/7",
+}
+
+
+def _config(keep_source=False):
+    """Return a loaded-config stand-in."""
+    config = MagicMock(keep_source=keep_source)
+    config.config = {"gitlab_mr": {"url": "https://gitlab.example.com"}}
+    return config
+
+
+def test_extract_issue_id_from_branch():
+    """Should extract Jira-style issue keys from branch names."""
+    assert extract_issue_id_from_branch("PROJ-123-some-feature") == "PROJ-123"
+    assert extract_issue_id_from_branch("feature/FOO_BAR-9/desc") == "FOO_BAR-9"
+    assert extract_issue_id_from_branch("fix-login-bug") is None
+
+
+@patch("git.Repo")
+@patch("gibr.cli.mr.load_issue", return_value=None)
+@patch("gibr.cli.mr.get_tracker")
+@patch("gibr.cli.mr.push_current_branch")
+@patch("gibr.cli.mr.current_branch_name", return_value="PROJ-1-fix-login")
+@patch("gibr.cli.mr.GitLabMR")
+def test_mr_pushes_and_uses_issue_title(
+    mock_gitlab_mr, mock_branch, mock_push, mock_get_tracker, _mock_load, mock_repo
+):
+    """Should push the branch and title the MR after the tracker issue."""
+    mock_get_tracker.return_value.get_issue.return_value = MagicMock(
+        title="Fix login"
+    )
+    gitlab_mr = mock_gitlab_mr.from_config.return_value
+    gitlab_mr.create_merge_request.return_value = MR_INFO
+
+    result = CliRunner().invoke(mr, [], obj={"config": _config()})
+
+    assert result.exit_code == 0
+    repo = mock_repo.return_value
+    mock_gitlab_mr.from_config.assert_called_once_with(
+        _config().config, repo=repo
+    )
+    mock_branch.assert_called_once_with(repo)
+    mock_push.assert_called_once_with(repo=repo, branch_name="PROJ-1-fix-login")
+    repo.close.assert_called_once()
+    gitlab_mr.create_merge_request.assert_called_once_with(
+        source_branch="PROJ-1-fix-login",
+        target_branch=None,
+        title="PROJ-1: Fix login",
+        description="",
+        remove_source_branch=True,
+    )
+
+
+@patch("git.Repo")
+@patch("gibr.cli.mr.get_tracker")
+@patch("gibr.cli.mr.push_current_branch", side_effect=click.Abort)
+@patch("gibr.cli.mr.current_branch_name", return_value="PROJ-1-fix-login")
+@patch("gibr.cli.mr.GitLabMR")
+def test_mr_push_failure_aborts_before_creating(
+    mock_gitlab_mr, _mock_branch, _mock_push, _mock_get_tracker, mock_repo
+):
+    """Should not create the MR when pushing the branch fails."""
+    result = CliRunner().invoke(mr, [], obj={"config": _config()})
+
+    assert result.exit_code != 0
+    mock_gitlab_mr.from_config.return_value.create_merge_request.assert_not_called()
+    mock_repo.return_value.close.assert_called_once()
+
+
+@patch("git.Repo")
+@patch("gibr.cli.mr.load_issue", return_value=None)
+@patch("gibr.cli.mr.get_tracker")
+@patch("gibr.cli.mr.push_current_branch")
+@patch("gibr.cli.mr.current_branch_name", return_value="PROJ-1-fix-login")
+@patch("gibr.cli.mr.GitLabMR")
+def test_mr_tracker_failure_falls_back_without_worker_output(
+    mock_gitlab_mr,
+    _mock_branch,
+    _mock_push,
+    mock_get_tracker,
+    _mock_load,
+    _mock_repo,
+    caplog,
+):
+    """Tracker errors on the worker thread should be logged, not printed there."""
+    mock_get_tracker.return_value.get_issue.side_effect = lambda issue_id: error(
+        f"Issue {issue_id} not found."
+    )
+    gitlab_mr = mock_gitlab_mr.from_config.return_value
+    gitlab_mr.create_merge_request.return_value = MR_INFO
+
+    with caplog.at_level(logging.DEBUG):
+        result = CliRunner().invoke(mr, [], obj={"config": _config()})
+
+    assert result.exit_code == 0
+    assert "not found" not in result.output
+    assert "Issue PROJ-1 not found." in caplog.text
+    assert "Could not fetch issue PROJ-1" in result.output
+    assert gitlab_mr.create_merge_request.call_args.kwargs["title"] is None
+
+
+@patch("git.Repo")
+@patch(
+    "gibr.cli.mr.load_issue", return_value={"id": "PROJ-1", "title": "Fix login"}
+)
+@patch("gibr.cli.mr.get_tracker")
+@patch("gibr.cli.mr.push_current_branch")
+@patch("gibr.cli.mr.current_branch_name", return_value="PROJ-1-fix-login")
+@patch("gibr.cli.mr.GitLabMR")
+def test_mr_no_push_uses_cached_issue(
+    mock_gitlab_mr, _mock_branch, mock_push, mock_get_tracker, _mock_load, _mock_repo
+):
+    """Should skip pushing and the tracker when --no-push and issue is cached."""
+    gitlab_mr = mock_gitlab_mr.from_config.return_value
+    gitlab_mr.create_merge_request.return_value = MR_INFO
+
+    result = CliRunner().invoke(
+        mr, ["--no-push", "--keep-source"], obj={"config": _config()}
+    )
+
+    assert result.exit_code == 0
+    mock_push.assert_not_called()
+    mock_get_tracker.assert_not_called()
+    kwargs = gitlab_mr.create_merge_request.call_args.kwargs
+    assert kwargs["title"] == "PROJ-1: Fix login"
+    assert kwargs["remove_source_branch"] is False
@@ -1,11 +1,12 @@
 """Tests for CLI notification utilities."""
 
+import logging
 from unittest.mock import patch
 
 import click
 import pytest
 
-from gibr.notify import error, info, party, success, warning
+from gibr.notify import error, info, party, quiet, success, warning
 
 
 @patch("gibr.notify.click.secho")
@@ -32,3 +33,17 @@ def test_error_function_raises_abort(mock_secho):
         error("fatal")
 
     mock_secho.assert_called_once_with("❌  fatal", fg="red", bold=True)
+
+
+@patch("gibr.notify.click.secho")
+def test_quiet_suppresses_output_but_error_still_raises(mock_secho, caplog):
+    """Inside quiet() messages are only logged, yet error() still aborts."""
+    with caplog.at_level(logging.DEBUG), quiet():
+        info("hidden")
+        with pytest.raises(click.Abort):
+            error("hidden failure")
+    mock_secho.assert_not_called()
+    assert "hidden failure" in caplog.text
+
+    info("shown")
+    mock_secho.assert_called_once_with("ℹ️  shown", fg="blue")
@@ -0,0 +1,88 @@
+"""Tests for translation utilities."""
+
+from unittest.mock import call, patch
+
+import pytest
+import requests
+from deep_translator import google
+
+from gibr.translate import (
+    _get_translator,
+    _use_shared_session,
+    auto_translate_if_needed,
+    detect_cyrillic,
+    translate_to_english,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_translation_cache():
+    """Ensure memoized translations do not leak between tests."""
+    auto_translate_if_needed.cache_clear()
+    yield
+    auto_translate_if_needed.cache_clear()
+
+
+def test_detect_cyrillic():
+    """Should detect Cyrillic characters only when present."""
+    assert detect_cyrillic("Исправить ошибку")
+    assert detect_cyrillic("Fix ёлка bug")
+    assert detect_cyrillic("Виправити помилку і")
+    assert not detect_cyrillic("Fix login bug")
+    assert not detect_cyrillic("Corriger l'échec de connexion")
+    assert not detect_cyrillic("")
+
+
+@patch("gibr.translate.translate_to_english")
+def test_auto_translate_skips_non_cyrillic(mock_translate):
+    """Should return non-Cyrillic text unchanged without translating."""
+    assert auto_translate_if_needed("Fix login bug") == "Fix login bug"
+    assert auto_translate_if_needed("") == ""
+    mock_translate.assert_not_called()
+
+
+@patch("gibr.translate.translate_to_english", return_value="Fix login bug")
+def test_auto_translate_memoizes_results(mock_translate):
+    """Should translate each distinct Cyrillic title only once."""
+    assert auto_translate_if_needed("Исправить вход") == "Fix login bug"
+    assert auto_translate_if_needed("Исправить вход") == "Fix login bug"
+    mock_translate.assert_called_once_with("Исправить вход")
+
+
+@patch("gibr.translate.detect_cyrillic")
+def test_auto_translate_skips_cyrillic_scan_for_ascii(mock_detect):
+    """Should not scan pure ASCII text for Cyrillic characters."""
+    assert auto_translate_if_needed("Fix login bug") == "Fix login bug"
+    mock_detect.assert_not_called()
+
+
+def test_translator_reuses_shared_session():
+    """deep_translator's Google backend should send requests over one session."""
+    original = google.requests
+    _use_shared_session.cache_clear()
+    try:
+        _use_shared_session()
+        assert google.requests.get.__self__.__class__ is requests.Session
+        assert google.requests.exceptions is requests.exceptions
+    finally:
+        google.requests = original
+        _use_shared_session.cache_clear()
+
+
+@patch("gibr.translate._use_shared_session")
+@patch("deep_translator.GoogleTranslator")
+def test_translate_to_english_reuses_translator_per_language(mock_translator_cls, _):
+    """translate_to_english should build one translator per source language."""
+    _get_translator.cache_clear()
+    mock_translator_cls.return_value.translate.return_value = "Hello"
+    try:
+        assert translate_to_english("Привет") == "Hello"
+        assert translate_to_english("Здравствуйте") == "Hello"
+        assert translate_to_english("Привіт", source_lang="uk") == "Hello"
+    finally:
+        _get_translator.cache_clear()
+
+    assert mock_translator_cls.call_args_list == [
+        call(source="ru", target="en"),
+        call(source="uk", target="en"),
+    ]